@@ -0,0 +1,150 @@
+# LINKED LIST BENCHMARK: O(1) tail appends in Modules 1-3
+# Author: Thejana Kottawatta (22307822)
+
+import time
+import random
+import os
+import tracemalloc
+import module1_graphs
+import module2_hash
+from module1_benchmark import GraphGenerator
+
+def MakeLegacyList(base_list):
+    """
+    Returns a copy of a module's DSALinkedList with the original behaviour: plain nodes
+    with a __dict__, and an insertLast that walks from head to tail on every append.
+    """
+    class LegacyLinkedList(base_list):
+        class DSAListNode:
+            def __init__(self, value):
+                self.value = value
+                self.next = None
+
+        def insertLast(self, value):
+            new_node = self.DSAListNode(value)
+            if self.head is None:
+                self.head = new_node
+            else:
+                current = self.head
+                while current.next:
+                    current = current.next
+                current.next = new_node
+            self.tail = new_node
+            self.count += 1
+
+    return LegacyLinkedList
+
+class AppendBenchmark:
+    """Times graph construction and hash-table loading with either linked list variant."""
+    def __init__(self, seed):
+        self.seed = seed
+        self.results = []
+
+    def Run(self, structure_name, variant_name, size, module, list_class, build_function):
+        """Swaps the module's DSALinkedList for list_class, then times and measures one build."""
+        original_list = module.DSALinkedList
+        module.DSALinkedList = list_class
+        try:
+            tracemalloc.start()
+            start_time = time.perf_counter()
+            build_function(size)
+            end_time = time.perf_counter()
+            peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        finally:
+            module.DSALinkedList = original_list
+
+        self.results.append({
+            "Structure": structure_name,
+            "Variant": variant_name,
+            "Size": size,
+            "Time (ms)": (end_time - start_time) * 1000,
+            "Peak (MB)": peak_bytes / (1024 * 1024)})
+
+    def BuildGraph(self, size):
+        """Builds a generated floor plan with 'size' departments."""
+        return GraphGenerator(self.seed).GenerateFloorPlan(size)
+
+    def LoadHashTable(self, size):
+        """Loads 'size' patient records with unique random IDs into a quiet table starting from capacity 11."""
+        random.seed(self.seed)
+        table = module2_hash.DSAHashTable(initial_size=11, verbose=False) # Time the appends, not log formatting
+        for patient_id in random.sample(range(1, size * 10), size):
+            table.insert(module2_hash.PatientRecord(patient_id, f"Patient {patient_id}", 40, "Wards", 3))
+        return table
+
+    def DisplayResults(self):
+        """Builds the benchmark results table as a list of strings."""
+        output = []
+
+        table_width = 66
+        header = "\n" + "="*table_width
+        header += "\n--- Linked List Append Benchmark Results ---"
+        header += "\n" + "="*table_width
+        output.append(header)
+
+        cols = f"{'Structure':<12} | {'Variant':<12} | {'Size':<7} | {'Time (ms)':<11} | {'Peak (MB)':<9}"
+        output.append(cols)
+        output.append("-"*table_width)
+
+        for res in self.results:
+            row = f"{res['Structure']:<12} | {res['Variant']:<12} | {res['Size']:<7} | " \
+                  f"{res['Time (ms)']:<11.1f} | {res['Peak (MB)']:<9.2f}"
+            output.append(row)
+
+        output.append("="*table_width)
+        return output
+
+def main():
+    """Benchmark driver"""
+    file_output = []
+
+    Seed = 41
+    sizes = [1000, 10000, 100000]
+    legacy_graph_limit = 10000 # Walking the vertex list per append is O(V^2); skip it above this
+
+    benchmark = AppendBenchmark(Seed)
+    legacy_graph_list = MakeLegacyList(module1_graphs.DSALinkedList)
+    legacy_hash_list = MakeLegacyList(module2_hash.DSALinkedList)
+
+    file_output.append("#"*48)
+    file_output.append("###   Linked List Append Benchmark (M1, M2)   ###")
+    file_output.append("#"*48)
+
+    for size in sizes:
+        print(f"Running size {size}...")
+        if size <= legacy_graph_limit:
+            benchmark.Run("Graph build", "Tail walk", size, module1_graphs, legacy_graph_list, benchmark.BuildGraph)
+        benchmark.Run("Graph build", "Tail + slots", size, module1_graphs,
+                      module1_graphs.DSALinkedList, benchmark.BuildGraph)
+        benchmark.Run("Hash load", "Tail walk", size, module2_hash, legacy_hash_list, benchmark.LoadHashTable)
+        benchmark.Run("Hash load", "Tail + slots", size, module2_hash,
+                      module2_hash.DSALinkedList, benchmark.LoadHashTable)
+
+    file_output.extend(benchmark.DisplayResults())
+    file_output.append("\nNotes:")
+    file_output.append(" - 'Tail walk' is the original insertLast (walk head to tail, nodes with a __dict__).")
+    file_output.append(" - 'Tail + slots' keeps a tail pointer (O(1) append) and uses __slots__ nodes.")
+    file_output.append(f" - The tail-walk graph build is only run up to {legacy_graph_limit} departments,")
+    file_output.append("   since appending to the vertex list makes it quadratic.")
+    file_output.append(" - Hash tables are quiet (verbose=False), so the hash load times the chain appends")
+    file_output.append("   and resizes rather than formatting a log line per insert.")
+    file_output.append("   Chains stay short below load 0.7, so there the gain is mostly the smaller nodes.")
+    file_output.append(" - Peak memory is measured with tracemalloc, which also slows both variants down.")
+
+    final_output_string = "\n".join(file_output)
+    print(final_output_string)
+
+    output_dir = "output"
+    output_file = os.path.join(output_dir, "linkedlist_benchmark_results.txt")
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(final_output_string)
+        print(f"\nBenchmark complete. Results also saved to {output_file}")
+    except Exception as e:
+        print(f"\nError: Could not save results file to {output_file}")
+        print(f"Details: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+# MODULE 1 BENCHMARK: Shortest-Path Search Modes
+# Author: Thejana Kottawatta (22307822)
+
+import time
+import random
+import os
+import io
+import csv
+from contextlib import redirect_stdout
+from module1_graphs import DSAGraph
+
+class GraphGenerator:
+    """Generates synthetic hospital floor plans with a reproducible random seed."""
+    LAYOUTS = ("grid", "tree", "small-world", "multi-floor")
+
+    def __init__(self, seed):
+        self.seed = seed
+        self.max_walking_time = 9 # Max corridor walking time in minutes
+
+    def GenerateFloorPlan(self, size, long_corridors=True):
+        """
+        Builds a DSAGraph of 'size' departments laid out on a square grid of corridors
+        (each department linked to its east and south neighbour) plus a few random
+        shortcuts, so the layout is connected and roughly planar like a real floor plan.
+        long_corridors=False leaves the shortcuts out (a plain planar grid, same weights).
+        """
+        random.seed(self.seed)
+        graph = DSAGraph()
+        width = 1
+        while width * width < size:
+            width += 1
+
+        for i in range(size):
+            graph.addVertex(f"Dept{i}")
+        for i in range(size):
+            if (i + 1) % width != 0 and i + 1 < size: # East neighbour on the same row
+                graph.addEdge(f"Dept{i}", f"Dept{i + 1}", random.randint(1, self.max_walking_time))
+            if i + width < size: # South neighbour on the next row
+                graph.addEdge(f"Dept{i}", f"Dept{i + width}", random.randint(1, self.max_walking_time))
+        if not long_corridors:
+            return graph
+        for _ in range(size // 20): # Occasional long corridors / lifts
+            a = random.randint(0, size - 1)
+            b = random.randint(0, size - 1)
+            if a != b:
+                graph.addEdge(f"Dept{a}", f"Dept{b}", random.randint(1, self.max_walking_time * 4))
+        return graph
+
+    def GenerateCorridors(self, layout, size):
+        """
+        Yields reproducible (i, j, walking_time) corridors between departments 0..size-1 for
+        one of the LAYOUTS. Corridors are streamed so 10^6-department layouts can be written
+        to CSV without holding them in memory.
+          grid        - square grid, each department linked east and south
+          tree        - branching wings: each department hangs off one of the 10 before it,
+                        giving a deep, cycle-free layout (the worst case for DFS depth)
+          small-world - ring where each department reaches the next two, with 10% of the
+                        corridors rewired to a random department (Watts-Strogatz)
+          multi-floor - a stack of grid floors joined by four lift shafts at fixed spots
+        """
+        random.seed(self.seed + size)
+        if layout == "grid":
+            width = 1
+            while width * width < size:
+                width += 1
+            for i in range(size):
+                if (i + 1) % width != 0 and i + 1 < size:
+                    yield i, i + 1, random.randint(1, self.max_walking_time)
+                if i + width < size:
+                    yield i, i + width, random.randint(1, self.max_walking_time)
+        elif layout == "tree":
+            for i in range(1, size):
+                yield random.randint(max(0, i - 10), i - 1), i, random.randint(1, self.max_walking_time)
+        elif layout == "small-world":
+            for i in range(size):
+                for step in (1, 2):
+                    if size <= step: # Too few departments to reach this far round the ring
+                        continue
+                    j = (i + step) % size
+                    if random.random() < 0.1:
+                        j = random.randint(0, size - 1)
+                        if j == i:
+                            continue
+                    yield i, j, random.randint(1, self.max_walking_time)
+        elif layout == "multi-floor":
+            floors = max(1, round(size ** (1 / 3)))
+            floor_size = size // floors
+            width = 1
+            while width * width < floor_size:
+                width += 1
+            lifts = sorted({0, width - 1, floor_size - width, floor_size - 1}) # Roughly the four corners
+            for floor in range(floors):
+                base = floor * floor_size
+                rooms = floor_size if floor < floors - 1 else size - base # Top floor takes the remainder
+                for k in range(rooms):
+                    if (k + 1) % width != 0 and k + 1 < rooms:
+                        yield base + k, base + k + 1, random.randint(1, self.max_walking_time)
+                    if k + width < rooms:
+                        yield base + k, base + k + width, random.randint(1, self.max_walking_time)
+                if floor > 0:
+                    for k in lifts:
+                        if 0 <= k < floor_size:
+                            yield base - floor_size + k, base + k, random.randint(2, 5) # Lift ride
+        else:
+            raise ValueError(f"Unknown layout '{layout}'.")
+
+    def GenerateLayout(self, layout, size):
+        """Builds one of the LAYOUTS directly as a DSAGraph, without going through CSV."""
+        graph = DSAGraph()
+        for i in range(size):
+            graph.addVertex(f"Dept{i}")
+        for i, j, walking_time in self.GenerateCorridors(layout, size):
+            graph.addEdge(f"Dept{i}", f"Dept{j}", walking_time)
+        return graph
+
+    def WriteCsv(self, layout, size, directory):
+        """
+        Writes departments.csv and corridors.csv for a generated layout into 'directory',
+        in the same schema as the files in input/. Returns the two file paths.
+        """
+        os.makedirs(directory, exist_ok=True)
+        depts_file = os.path.join(directory, "departments.csv")
+        corridors_file = os.path.join(directory, "corridors.csv")
+        with open(depts_file, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["department_name"])
+            for i in range(size):
+                writer.writerow([f"Dept{i}"])
+        with open(corridors_file, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["department1", "department2", "walking_time"])
+            for i, j, walking_time in self.GenerateCorridors(layout, size):
+                writer.writerow([f"Dept{i}", f"Dept{j}", walking_time])
+        return depts_file, corridors_file
+
+    def GenerateQueries(self, size, count):
+        """Returns a list of reproducible (start, end) label pairs."""
+        random.seed(self.seed + size)
+        queries = []
+        for _ in range(count):
+            queries.append((f"Dept{random.randint(0, size - 1)}", f"Dept{random.randint(0, size - 1)}"))
+        return queries
+
+class PathBenchmark:
+    """Runs each shortest-path mode over the same queries and collects results."""
+    def __init__(self):
+        self.results = []
+
+    def Run(self, graph, mode_name, queries):
+        """Times one mode over all queries, recording average settled vertices and costs."""
+        total_settled = 0
+        costs = []
+
+        start_time = time.perf_counter()
+        for start_label, end_label in queries:
+            if mode_name == "Linear":
+                graph.clearPathCache(keep_landmarks=True) # Measure a full search, not a cached tree; A* keeps its landmarks
+                tree = graph.getPathTree(start_label, use_heap=False)
+                cost, settled = tree.getDistance(graph.getVertex(end_label)), tree.settled
+            elif mode_name == "Heap":
+                graph.clearPathCache(keep_landmarks=True)
+                tree = graph.getPathTree(start_label, use_heap=True)
+                cost, settled = tree.getDistance(graph.getVertex(end_label)), tree.settled
+            else:
+                if mode_name == "Bidirectional":
+                    result = graph.bidirectionalDijkstra(start_label, end_label, verbose=False)
+                else: # "A* (ALT)"
+                    result = graph.aStarPath(start_label, end_label, verbose=False)
+                cost, settled = result.cost, result.settled
+            total_settled += settled
+            costs.append(cost)
+        end_time = time.perf_counter()
+
+        self.results.append({
+            "Mode": mode_name,
+            "Size": len(graph._vertices),
+            "Queries": len(queries),
+            "Avg settled": total_settled / len(queries),
+            "Avg time (ms)": (end_time - start_time) * 1000 / len(queries)})
+        return costs
+
+    def DisplayResults(self):
+        """Builds the benchmark results table as a list of strings."""
+        output = []
+
+        table_width = 72
+        header = "\n" + "="*table_width
+        header += "\n--- Shortest-Path Mode Benchmark Results ---"
+        header += "\n" + "="*table_width
+        output.append(header)
+
+        cols = f"{'Mode':<14} | {'Size':<7} | {'Queries':<7} | {'Avg settled':<12} | {'Avg time (ms)':<13}"
+        output.append(cols)
+        output.append("-"*table_width)
+
+        for res in self.results:
+            row = f"{res['Mode']:<14} | {res['Size']:<7} | {res['Queries']:<7} | " \
+                  f"{res['Avg settled']:<12.1f} | {res['Avg time (ms)']:<13.3f}"
+            output.append(row)
+
+        output.append("="*table_width)
+        return output
+
+def main():
+    """Benchmark driver"""
+    file_output = []
+
+    Seed = 41 # Deterministic seed for reproducible floor plans and queries
+    sizes = [1000, 10000, 100000] # Departments per generated floor plan
+    num_queries = 5
+    linear_limit = 10000 # The O(V^2) scan is skipped above this size
+
+    generator = GraphGenerator(Seed)
+    benchmark = PathBenchmark()
+
+    file_output.append("#"*52)
+    file_output.append("###   MODULE 1: Shortest-Path Search Benchmark   ###")
+    file_output.append("#"*52)
+
+    for size in sizes:
+        print(f"Generating floor plan with {size} departments...")
+        graph = generator.GenerateFloorPlan(size)
+        queries = generator.GenerateQueries(size, num_queries)
+
+        start_time = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            graph.buildLandmarks()
+        landmark_ms = (time.perf_counter() - start_time) * 1000
+        file_output.append(f"Size {size}: landmark preprocessing took {landmark_ms:.1f} ms")
+
+        modes = ["Heap", "Bidirectional", "A* (ALT)"]
+        if size <= linear_limit:
+            modes.insert(0, "Linear")
+        expected = None
+        for mode_name in modes:
+            print(f"  Running {mode_name}...")
+            costs = benchmark.Run(graph, mode_name, queries)
+            if expected is None:
+                expected = costs
+            elif costs != expected: # Every mode must agree on the walking times
+                file_output.append(f"  WARNING: {mode_name} costs {costs} differ from {expected}")
+
+    file_output.extend(benchmark.DisplayResults())
+    file_output.append("\nNotes:")
+    file_output.append(" - 'Avg settled' counts vertices removed from the priority queue (A*: nodes expanded).")
+    file_output.append(" - Linear and Heap settle every reachable department; Bidirectional and A*")
+    file_output.append("   stop once the destination's shortest path is proven.")
+    file_output.append(f" - Linear (O(V^2)) is only run up to {linear_limit} departments.")
+
+    final_output_string = "\n".join(file_output)
+    print(final_output_string)
+
+    output_dir = "output"
+    output_file = os.path.join(output_dir, "1benchmark_results.txt")
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(final_output_string)
+        print(f"\nBenchmark complete. Results also saved to {output_file}")
+    except Exception as e:
+        print(f"\nError: Could not save results file to {output_file}")
+        print(f"Details: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# MODULE 1 BENCHMARK: Graph Build and Traversal Scaling
+# Author: Thejana Kottawatta (22307822)
+
+import time
+import os
+import gc
+import tempfile
+from module1_graphs import DSAGraph
+from module1_benchmark import GraphGenerator
+
+class GraphBenchmark:
+    """Builds generated layouts from CSV and times the core DSAGraph operations on them."""
+    def __init__(self, generator):
+        self.generator = generator
+        self.results = []
+
+    def Run(self, layout, size, work_dir):
+        """
+        Writes the layout's CSV pair to work_dir, then times the CSV build (fromCsv), a BFS
+        and a full DFS from Dept0 (every back edge, as depthFirstSearchCycleFind uses) and
+        one Dijkstra from Dept0 to the last department. The graph is then saved in the
+        binary format and the cold start (mmap open) and the same Dijkstra on the mapped
+        CSR arrays are timed too.
+        """
+        depts_file, corridors_file = self.generator.WriteCsv(layout, size, work_dir)
+
+        start_time = time.perf_counter()
+        graph = DSAGraph.fromCsv(depts_file, corridors_file)
+        build_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        graph.breadthFirstSearch("Dept0", verbose=False)
+        bfs_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        back_edges = graph.DfsBackEdges(stop_at_first=False)
+        dfs_ms = (time.perf_counter() - start_time) * 1000
+
+        graph.connectivityAnalysis(verbose=False) # Cached reachability check, not part of the search
+        start_time = time.perf_counter()
+        result = graph.dijkstraAlgorithm("Dept0", f"Dept{size - 1}", verbose=False)
+        dijkstra_ms = (time.perf_counter() - start_time) * 1000
+
+        binary_file = os.path.join(work_dir, "graph.bin")
+        graph.saveBinary(binary_file)
+        start_time = time.perf_counter()
+        mapped = DSAGraph.openBinary(binary_file)
+        open_ms = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        mapped_result = mapped.dijkstraAlgorithm("Dept0", f"Dept{size - 1}", verbose=False)
+        mapped_ms = (time.perf_counter() - start_time) * 1000
+        mapped.close()
+
+        self.results.append({
+            "Layout": layout,
+            "Size": size,
+            "Corridors": graph.loadStats.corridor_rows,
+            "Build (ms)": build_ms,
+            "Rows/sec": graph.loadStats.getRowsPerSecond(),
+            "BFS (ms)": bfs_ms,
+            "DFS (ms)": dfs_ms,
+            "Cycles": len(back_edges),
+            "Dijkstra (ms)": dijkstra_ms,
+            "Open (ms)": open_ms,
+            "Mapped Dijkstra (ms)": mapped_ms,
+            "Same cost": "Yes" if mapped_result.cost == result.cost else "NO_FAIL"})
+
+        del graph, back_edges, result, mapped, mapped_result
+        gc.collect() # Free the large layouts before building the next one
+
+    def DisplayResults(self):
+        """Builds the benchmark results table as a list of strings."""
+        output = []
+
+        table_width = 134
+        header = "\n" + "="*table_width
+        header += "\n--- Graph Build and Traversal Benchmark Results ---"
+        header += "\n" + "="*table_width
+        output.append(header)
+
+        cols = f"{'Layout':<11} | {'Size':<7} | {'Corridors':<9} | {'Build (ms)':<10} | {'Rows/sec':<8} | " \
+               f"{'BFS (ms)':<9} | {'DFS (ms)':<9} | {'Cycles':<7} | {'Dijkstra (ms)':<13} | {'Open (ms)':<9} | " \
+               f"{'Mapped (ms)':<11} | {'Same cost'}"
+        output.append(cols)
+        output.append("-"*table_width)
+
+        for res in self.results:
+            row = f"{res['Layout']:<11} | {res['Size']:<7} | {res['Corridors']:<9} | {res['Build (ms)']:<10.1f} | " \
+                  f"{res['Rows/sec']:<8.0f} | {res['BFS (ms)']:<9.1f} | {res['DFS (ms)']:<9.1f} | " \
+                  f"{res['Cycles']:<7} | {res['Dijkstra (ms)']:<13.1f} | {res['Open (ms)']:<9.3f} | " \
+                  f"{res['Mapped Dijkstra (ms)']:<11.1f} | {res['Same cost']}"
+            output.append(row)
+
+        output.append("="*table_width)
+        return output
+
+def main():
+    """Benchmark driver"""
+    file_output = []
+
+    Seed = 41
+    sizes = [10**2, 10**3, 10**4, 10**5, 10**6] # 10**6 peaks at about 1.5 GB of memory
+
+    benchmark = GraphBenchmark(GraphGenerator(Seed))
+
+    file_output.append("#"*57)
+    file_output.append("###   MODULE 1: Graph Build and Traversal Benchmark   ###")
+    file_output.append("#"*57)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for layout in GraphGenerator.LAYOUTS:
+            for size in sizes:
+                print(f"Running {layout} layout with {size} departments...")
+                benchmark.Run(layout, size, work_dir)
+
+    file_output.extend(benchmark.DisplayResults())
+    file_output.append("\nNotes:")
+    file_output.append(" - Each layout is written to departments.csv / corridors.csv (the input/ schema)")
+    file_output.append("   by GraphGenerator.WriteCsv and loaded with DSAGraph.fromCsv.")
+    file_output.append(" - BFS and Dijkstra cover the component of Dept0, DFS the whole graph; 'Cycles' is")
+    file_output.append("   the number of DFS back edges (independent cycles), 0 for the tree layout.")
+    file_output.append(" - Dijkstra runs from Dept0 to the last department on a fresh path cache; the")
+    file_output.append("   connectivity index it checks first is built beforehand and not timed.")
+    file_output.append(" - 'Open' is the cold start from the binary graph file (DSAGraph.openBinary, mmap);")
+    file_output.append("   compare with 'Build' from CSV. 'Mapped' is the same Dijkstra run directly on the")
+    file_output.append("   memory-mapped CSR arrays.")
+
+    final_output_string = "\n".join(file_output)
+    print(final_output_string)
+
+    output_dir = "output"
+    output_file = os.path.join(output_dir, "1graph_benchmark_results.txt")
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(final_output_string)
+        print(f"\nBenchmark complete. Results also saved to {output_file}")
+    except Exception as e:
+        print(f"\nError: Could not save results file to {output_file}")
+        print(f"Details: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# MODULE 1 BENCHMARK: Spanning Trees and Steiner Cable Routing
+# Author: Thejana Kottawatta (22307822)
+
+import time
+import random
+import os
+import math
+from module1_benchmark import GraphGenerator
+
+class TreeBenchmark:
+    """Times Kruskal, Prim and the Steiner approximation on generated layouts."""
+    def __init__(self):
+        self.results = []
+
+    def Run(self, layout, graph, algorithm_name, tree_function):
+        """Times tree_function() once and records the cost and the time per E log2 E."""
+        num_edges = graph.countEdges()
+        start_time = time.perf_counter()
+        result = tree_function()
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        self.results.append({
+            "Layout": layout,
+            "Algorithm": algorithm_name,
+            "Vertices": len(graph._vertices),
+            "Corridors": num_edges,
+            "Time (ms)": duration_ms,
+            "ns/(E log E)": duration_ms * 1e6 / (num_edges * math.log2(num_edges)),
+            "Cost": result.cost,
+            "Trees": result.trees})
+        return result
+
+    def DisplayResults(self):
+        """Builds the benchmark results table as a list of strings."""
+        output = []
+
+        table_width = 100
+        header = "\n" + "="*table_width
+        header += "\n--- Spanning Tree / Steiner Tree Benchmark Results ---"
+        header += "\n" + "="*table_width
+        output.append(header)
+
+        cols = f"{'Layout':<11} | {'Algorithm':<9} | {'Vertices':<8} | {'Corridors':<9} | {'Time (ms)':<10} | " \
+               f"{'ns/(E log E)':<12} | {'Cost':<9} | {'Trees'}"
+        output.append(cols)
+        output.append("-"*table_width)
+
+        for res in self.results:
+            row = f"{res['Layout']:<11} | {res['Algorithm']:<9} | {res['Vertices']:<8} | {res['Corridors']:<9} | " \
+                  f"{res['Time (ms)']:<10.1f} | {res['ns/(E log E)']:<12.1f} | {res['Cost']:<9} | {res['Trees']}"
+            output.append(row)
+
+        output.append("="*table_width)
+        return output
+
+def main():
+    """Benchmark driver"""
+    file_output = []
+
+    Seed = 41
+    layouts = ["grid", "small-world"]
+    sizes = [500, 5000, 50000] # Departments; both layouts have about 2 corridors per department (10^3-10^5)
+    terminal_share = 100 # One Steiner terminal per this many departments
+
+    generator = GraphGenerator(Seed)
+    benchmark = TreeBenchmark()
+
+    file_output.append("#"*62)
+    file_output.append("###   MODULE 1: Spanning Tree and Steiner Tree Benchmark   ###")
+    file_output.append("#"*62)
+
+    for layout in layouts:
+        for size in sizes:
+            print(f"Running {layout} layout with {size} departments...")
+            graph = generator.GenerateLayout(layout, size)
+            random.seed(Seed + size)
+            terminals = [f"Dept{i}" for i in random.sample(range(size), max(5, size // terminal_share))]
+
+            kruskal = benchmark.Run(layout, graph, "Kruskal", lambda: graph.kruskalMST(verbose=False))
+            prim = benchmark.Run(layout, graph, "Prim", lambda: graph.primMST(verbose=False))
+            steiner = benchmark.Run(layout, graph, "Steiner", lambda: graph.steinerTree(terminals, verbose=False))
+            if kruskal.cost != prim.cost: # Both must find a minimum spanning tree
+                file_output.append(f"  WARNING: Kruskal ({kruskal.cost}) and Prim ({prim.cost}) disagree "
+                                   f"on {layout} {size}")
+            file_output.append(f"{layout} {size}: Steiner tree joins {len(terminals)} terminals with "
+                               f"{len(steiner.edges)} corridors (MST needs {len(kruskal.edges)})")
+
+    file_output.extend(benchmark.DisplayResults())
+    file_output.append("\nNotes:")
+    file_output.append(" - 'ns/(E log E)' is the time divided by E log2 E; it stays roughly flat as E grows")
+    file_output.append("   a hundredfold, i.e. all three scale near-linearithmically.")
+    file_output.append(" - Kruskal sorts every corridor up front; Prim and Steiner (Mehlhorn's 2-approximation:")
+    file_output.append("   one multi-source Dijkstra plus Kruskal over the region links) use the DSAMinHeap.")
+    file_output.append(f" - Steiner terminals are a seeded random 1/{terminal_share} of the departments (at least 5).")
+
+    final_output_string = "\n".join(file_output)
+    print(final_output_string)
+
+    output_dir = "output"
+    output_file = os.path.join(output_dir, "1mst_benchmark_results.txt")
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(final_output_string)
+        print(f"\nBenchmark complete. Results also saved to {output_file}")
+    except Exception as e:
+        print(f"\nError: Could not save results file to {output_file}")
+        print(f"Details: {e}")
+
+if __name__ == "__main__":
+    main()
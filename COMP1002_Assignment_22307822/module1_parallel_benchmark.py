@@ -0,0 +1,103 @@
+# MODULE 1 BENCHMARK: Serial vs Process-Pool All-Sources Travel-Time Tables
+# Author: Thejana Kottawatta (22307822)
+
+import time
+import os
+from module1_benchmark import GraphGenerator
+
+class ParallelBenchmark:
+    """Times DSAFrozenGraph.allSourcesDistances serially and over process pools of several sizes."""
+    def __init__(self):
+        self.results = []
+
+    def Run(self, size, frozen_graph, workers, serial_seconds=None, serial_rows=None):
+        """
+        Times one all-sources table with the given worker count (pool start-up and shipping
+        the graph to every worker included). Returns (seconds, rows) so the pooled runs can
+        be checked against, and compared with, the serial one.
+        """
+        start_time = time.perf_counter()
+        rows = frozen_graph.allSourcesDistances(workers=workers)
+        seconds = time.perf_counter() - start_time
+
+        self.results.append({
+            "Size": size,
+            "Workers": workers,
+            "Time (s)": seconds,
+            "Rows/sec": len(rows) / seconds,
+            "Speedup": serial_seconds / seconds if serial_seconds is not None else 1.0,
+            "Rows match": serial_rows is None or rows == serial_rows})
+        return seconds, rows
+
+    def DisplayResults(self):
+        """Builds the benchmark results table as a list of strings."""
+        output = []
+
+        table_width = 66
+        header = "\n" + "="*table_width
+        header += "\n--- All-Sources Distance Table Benchmark Results ---"
+        header += "\n" + "="*table_width
+        output.append(header)
+
+        cols = f"{'Size':<6} | {'Workers':<7} | {'Time (s)':<9} | {'Rows/sec':<9} | {'Speedup':<7} | {'Rows match'}"
+        output.append(cols)
+        output.append("-"*table_width)
+
+        for res in self.results:
+            row = f"{res['Size']:<6} | {res['Workers']:<7} | {res['Time (s)']:<9.2f} | {res['Rows/sec']:<9.1f} | " \
+                  f"{res['Speedup']:<7.2f} | {'yes' if res['Rows match'] else 'NO'}"
+            output.append(row)
+
+        output.append("="*table_width)
+        return output
+
+def main():
+    """Benchmark driver"""
+    file_output = []
+
+    Seed = 41
+    sizes = [1000, 2000, 8000] # Departments; every one of them is a source
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({max(2, cpus)} | {w for w in (2, 4, 8) if w <= cpus}) # Always at least one pooled run
+
+    generator = GraphGenerator(Seed)
+    benchmark = ParallelBenchmark()
+
+    file_output.append("#"*58)
+    file_output.append("###   MODULE 1: All-Sources Distance Table Benchmark   ###")
+    file_output.append("#"*58)
+
+    for size in sizes:
+        print(f"Generating floor plan with {size} departments...")
+        frozen_graph = generator.GenerateFloorPlan(size).freeze()
+        print("  Running serially...")
+        serial_seconds, serial_rows = benchmark.Run(size, frozen_graph, 1)
+        for workers in worker_counts:
+            print(f"  Running with {workers} workers...")
+            benchmark.Run(size, frozen_graph, workers, serial_seconds, serial_rows)
+
+    file_output.extend(benchmark.DisplayResults())
+    file_output.append("\nNotes:")
+    file_output.append(f" - Measured on a machine with {cpus} CPU(s); workers beyond the CPU count only add overhead.")
+    if cpus == 1:
+        file_output.append("   Rerun this script on a multi-core machine to measure the speedup.")
+    file_output.append(" - Workers=1 is the default serial path; larger counts pass workers= to")
+    file_output.append("   allSourcesDistances, which ships the frozen graph to each worker once.")
+    file_output.append(" - Times include starting the pool; 'Rows match' compares every row with the serial run.")
+
+    final_output_string = "\n".join(file_output)
+    print(final_output_string)
+
+    output_dir = "output"
+    output_file = os.path.join(output_dir, "1parallel_benchmark_results.txt")
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(final_output_string)
+        print(f"\nBenchmark complete. Results also saved to {output_file}")
+    except Exception as e:
+        print(f"\nError: Could not save results file to {output_file}")
+        print(f"Details: {e}")
+
+if __name__ == "__main__":
+    main()
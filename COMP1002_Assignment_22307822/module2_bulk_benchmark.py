@@ -0,0 +1,152 @@
+# MODULE 2 BENCHMARK: Bulk Loading patients.csv With Presizing
+# Author: Thejana Kottawatta (22307822)
+
+import time
+import random
+import os
+import gc
+import csv
+import tempfile
+from module2_hash import DSAHashTable, ReadPatientCsv
+
+class BulkLoadBenchmark:
+    """Times loading one generated patients CSV row by row versus with DSAHashTable.bulkLoad."""
+    def __init__(self, seed):
+        self.seed = seed
+        self.results = []
+
+    def WriteCsv(self, size, directory):
+        """Writes 'size' patients with unique random IDs in the input/patients.csv format."""
+        random.seed(self.seed + size)
+        departments = ["Cardiology", "Neurology", "Emergency", "Pediatrics", "Oncology", "Radiology"]
+        file_path = os.path.join(directory, "patients.csv")
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["patient_id", "name", "age", "department", "urgency_level", "treatment_status"])
+            for patient_id in random.sample(range(1, size * 10), size):
+                writer.writerow([patient_id, f"Patient {patient_id}", random.randint(0, 99),
+                                 random.choice(departments), random.randint(1, 5), "Admitted"])
+        return file_path
+
+    def Run(self, mode_name, size, file_path, load_function):
+        """Times load_function(file_path), which returns the loaded table (or None), and counts its resizes."""
+        resizes = [0]
+        def CountResize(table):
+            resize = table.Resize
+            def Resize(new_capacity=None):
+                resizes[0] += 1
+                resize(new_capacity)
+            table.Resize = Resize # Instance attribute shadows the method for this table only
+            return table
+
+        start_time = time.perf_counter()
+        table = load_function(file_path, CountResize)
+        seconds = time.perf_counter() - start_time
+
+        self.results.append({
+            "Mode": mode_name,
+            "Size": size,
+            "Time (s)": seconds,
+            "Rows/sec": size / seconds,
+            "Resizes": resizes[0],
+            "Capacity": table.capacity if table is not None else 0,
+            "Load": table.getLoadFactor() if table is not None else 0.0})
+        del table
+        gc.collect() # Free the millions of records before the next run
+
+    def DisplayResults(self):
+        """Builds the benchmark results table as a list of strings."""
+        output = []
+
+        table_width = 92
+        header = "\n" + "="*table_width
+        header += "\n--- Bulk Load Benchmark Results ---"
+        header += "\n" + "="*table_width
+        output.append(header)
+
+        cols = f"{'Mode':<21} | {'Size':<7} | {'Time (s)':<8} | {'Rows/sec':<8} | {'Resizes':<7} | {'Capacity':<8} | {'Load'}"
+        output.append(cols)
+        output.append("-"*table_width)
+
+        for res in self.results:
+            row = f"{res['Mode']:<21} | {res['Size']:<7} | {res['Time (s)']:<8.2f} | {res['Rows/sec']:<8.0f} | " \
+                  f"{res['Resizes']:<7} | {res['Capacity']:<8} | {res['Load']:.2f}"
+            output.append(row)
+
+        output.append("="*table_width)
+        return output
+
+def ParseOnly(file_path, prepare):
+    """Reads and validates every row without storing it, the cost every mode shares."""
+    for _ in ReadPatientCsv(file_path):
+        pass
+    return None
+
+def InsertLoop(file_path, prepare):
+    """The module 2 driver's approach: insert row by row into a table starting at capacity 11."""
+    table = prepare(DSAHashTable(initial_size=11, verbose=False))
+    for record in ReadPatientCsv(file_path):
+        if record is not None:
+            table.insert(record)
+    return table
+
+def BulkLoad(file_path, prepare):
+    """DSAHashTable.bulkLoad on a chaining table starting at capacity 11."""
+    table = prepare(DSAHashTable(initial_size=11, verbose=False))
+    table.bulkLoad(file_path)
+    return table
+
+def BulkLoadRobinHood(file_path, prepare):
+    """DSAHashTable.bulkLoad on a robin_hood table starting at capacity 11."""
+    table = prepare(DSAHashTable(initial_size=11, verbose=False, storage="robin_hood"))
+    table.bulkLoad(file_path)
+    return table
+
+def main():
+    """Benchmark driver"""
+    file_output = []
+
+    Seed = 41
+    sizes = [10**5, 10**6, 5 * 10**6] # 5M patients peaks at about 3 GB of memory
+    modes = [("Parse only", ParseOnly), ("insert() loop", InsertLoop),
+             ("bulkLoad", BulkLoad), ("bulkLoad (robin_hood)", BulkLoadRobinHood)]
+
+    benchmark = BulkLoadBenchmark(Seed)
+
+    file_output.append("#"*41)
+    file_output.append("###   MODULE 2: Bulk Load Benchmark   ###")
+    file_output.append("#"*41)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in sizes:
+            print(f"Writing {size} patients...")
+            file_path = benchmark.WriteCsv(size, work_dir)
+            for mode_name, load_function in modes:
+                print(f"  Running {mode_name}...")
+                benchmark.Run(mode_name, size, file_path, load_function)
+
+    file_output.extend(benchmark.DisplayResults())
+    file_output.append("\nNotes:")
+    file_output.append(" - Every mode reads the same generated CSV (input/patients.csv format) from disk;")
+    file_output.append("   'Parse only' is the csv + PatientRecord validation cost they all share.")
+    file_output.append(" - 'insert() loop' grows from capacity 11 by doubling, re-hashing every record each")
+    file_output.append("   time. bulkLoad counts the file's rows first and makes its single resize up front,")
+    file_output.append("   while the table is still empty, so no record is ever re-hashed.")
+    file_output.append(" - All tables are quiet (verbose=False).")
+
+    final_output_string = "\n".join(file_output)
+    print(final_output_string)
+
+    output_dir = "output"
+    output_file = os.path.join(output_dir, "2bulk_benchmark_results.txt")
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(final_output_string)
+        print(f"\nBenchmark complete. Results also saved to {output_file}")
+    except Exception as e:
+        print(f"\nError: Could not save results file to {output_file}")
+        print(f"Details: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,23 @@
 import math
 import csv
 import os
+import operator
+import zlib
+from array import array
 from contextlib import redirect_stdout
 
 class DSALinkedList:
     """A custom implemented Linked List in order to avoid using built-in Python functions"""
     class DSAListNode:
+        __slots__ = ("value", "next") # No per-node __dict__, nodes are much smaller
+
         def __init__(self, value):
             self.value = value
             self.next = None
 
     def __init__(self):
         self.head = None
+        self.tail = None # Tail pointer so insertLast doesn't have to walk the chain
         self.count = 0
 
     def insertLast(self, value):
@@ -22,10 +28,8 @@ class DSALinkedList:
         if self.head is None:
             self.head = new_node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
         self.count += 1
 
     def removeByPatientID(self, patient_id):
@@ -38,6 +42,8 @@ class DSALinkedList:
                     self.head = current.next
                 else:
                     prev.next = current.next
+                if current is self.tail: # The node to remove is the tail
+                    self.tail = prev
                 self.count -= 1
                 return current.value # Return the data of the removed node
             prev, current = current, current.next
@@ -80,83 +86,349 @@ class PatientRecord:
                 f"Dept: {self.department}, Urgency: {self.urgencyLevel}, "
                 f"Status: {self.treatmentStatus}")
 
+    @staticmethod
+    def fromCsvRow(row):
+        """Builds a PatientRecord from a csv.DictReader row of a patients.csv-format file."""
+        return PatientRecord(
+            patientID=int(row['patient_id']),
+            name=row['name'],
+            age=int(row['age']),
+            department=row['department'],
+            urgencyLevel=int(row['urgency_level']),
+            treatmentStatus=row['treatment_status'])
+
+def ReadPatientCsv(file_path):
+    """Yields a PatientRecord for each row of a patients.csv-format file, or None for a row that fails validation."""
+    with open(file_path, mode='r', newline='') as file:
+        for row in csv.DictReader(file):
+            try:
+                yield PatientRecord.fromCsvRow(row)
+            except (ValueError, KeyError, TypeError): # TypeError: a short row leaves fields as None
+                yield None
+
+def CountCsvRows(file_path):
+    """Counts the data rows of a CSV file by its newlines (header excluded); an estimate if fields hold newlines."""
+    rows = 0
+    last_byte = b"\n"
+    with open(file_path, 'rb') as file:
+        while True:
+            block = file.read(1 << 20)
+            if not block:
+                break
+            rows += block.count(b"\n")
+            last_byte = block[-1:]
+    if last_byte != b"\n": # Last row has no line ending
+        rows += 1
+    return max(0, rows - 1)
+
+# Hash Functions
+
+FIBONACCI_MULTIPLIER = 11400714819323198485 # 2^64 / golden ratio, odd
+HASH_MASK = (1 << 64) - 1
+
+def PolynomialHash(key_str):
+    """The original string hash: h = 31*h + ord(c) over the characters (Java's String.hashCode)."""
+    hash_val = 0
+    for char in key_str:
+        hash_val = (31 * hash_val) + ord(char)
+    return hash_val
+
+def Crc32Hash(key_str):
+    """CRC-32 of the UTF-8 bytes, computed in C by zlib; stable across runs, unlike hash()."""
+    return zlib.crc32(key_str.encode())
+
 # Hash Table
 
-class DSAHashTable:
-    """A hash table implementation using chaining with DSALinkedList for collision resolution."""
+class DSAHashStats:
+    """
+    Counter sink for DSAHashTable's trace hook: counts each event and the chain hops
+    (records compared) of the lookups behind it. Pass an instance as trace=.
+    """
+    def __init__(self):
+        self.events = {} # event name -> count
+        self.hops = 0
+        self.max_hops = 0
+        self.lookups = 0 # Traced operations that walked a chain (everything but resizes)
+
+    def __call__(self, event, patientID, index, hops):
+        self.events[event] = self.events.get(event, 0) + 1
+        if event == "resize":
+            return
+        self.lookups += 1
+        self.hops += hops
+        if hops > self.max_hops:
+            self.max_hops = hops
+
+    def getAverageHops(self):
+        if self.lookups == 0:
+            return 0.0
+        return self.hops / self.lookups
+
+    def __str__(self):
+        events_str = ", ".join(f"{event}: {count}" for event, count in self.events.items())
+        return (f"{self.lookups} lookups, {self.getAverageHops():.2f} hops on average "
+                f"(max {self.max_hops}); {events_str}")
 
-    def __init__(self, initial_size=23): # Start with a prime number
+class DSAHashTable:
+    """
+    A hash table implementation using chaining with DSALinkedList for collision resolution.
+    Buckets are created on first use (an empty bucket is None), so growing the table only
+    allocates one flat list of slots.
+
+    incremental_resize=True spreads each resize over the following operations: the old and
+    new bucket arrays are kept side by side and every insert, search or delete migrates
+    migrate_step old buckets, so no single operation has to rehash the whole table.
+
+    verbose=False silences the per-operation log lines. trace, if given, is called as
+    trace(event, patientID, index, hops) after every operation, with event one of "insert",
+    "update", "hit", "miss", "delete", "delete_miss" or "resize" (patientID None, index
+    the new capacity); DSAHashStats is a ready-made counter sink.
+
+    Integer keys (patient IDs) take a Fibonacci-hashing fast path unless int_fast_path is
+    False; every other key is hashed as a string with string_hash (any function from str
+    to int, PolynomialHash by default).
+
+    storage="robin_hood" swaps the buckets for open addressing over three flat parallel
+    arrays (keys, records, probe distances) with Robin Hood linear probing and backward-shift
+    deletion. insert/search/delete behave the same; hops then count the slots probed.
+    """
+
+    def __init__(self, initial_size=23, incremental_resize=False, verbose=True, trace=None,
+                 string_hash=PolynomialHash, int_fast_path=True, storage="chaining"): # Start with a prime number
+        if storage not in ("chaining", "robin_hood"):
+            raise ValueError(f"Unknown storage '{storage}', expected 'chaining' or 'robin_hood'.")
+        if incremental_resize and storage != "chaining":
+            raise ValueError("incremental_resize is only supported with chaining storage.")
         self.capacity = self.FindNextPrime(initial_size)
+        self.storage = storage
 
-        self.table = [DSALinkedList() for _ in range(self.capacity)] 
         self.count = 0
-        self.max_load_factor = 0.7
-
-    def Hash(self, key):
-        """A simple modulo-based hash function."""
-        key_str = str(key)
-        hash_val = 0
-        for char in key_str:
-            hash_val = (31 * hash_val) + ord(char)
+        if storage == "robin_hood":
+            self.table = None
+            self.AllocateSlots()
+            self.max_load_factor = 0.85 # Robin Hood keeps probe lengths short at higher loads
+        else:
+            self.table = [None] * self.capacity
+            self.max_load_factor = 0.7
+
+        self.incremental_resize = incremental_resize
+        self.migrate_step = 4 # Old buckets moved per operation; finishes well before the next resize is due
+        self.old_table = None # Bucket array still being migrated (incremental mode only)
+        self.old_capacity = 0
+        self.migrate_index = 0 # Old buckets below this index have been moved
+
+        self.verbose = verbose
+        self.trace = trace
+
+        self.string_hash = string_hash
+        self.int_fast_path = int_fast_path
+
+    def Hash(self, key, capacity=None):
+        """
+        Maps key to a bucket index below capacity (default: the current table size).
+        Integer keys on the fast path are multiplied by 2^64/phi (Fibonacci hashing), which
+        spreads sequential and strided IDs, and the 64-bit product is scaled into range with
+        a multiply and shift instead of a modulo. Other keys go through string_hash.
+        """
+        if capacity is None:
+            capacity = self.capacity
+        if self.int_fast_path and type(key) is int:
+            return ((key * FIBONACCI_MULTIPLIER) & HASH_MASK) * capacity >> 64
         ## Implement a simple modulo-based hash function; explain parameter choices 
         # (table size, prime selection). 
-        return abs(hash_val % self.capacity)
+        return self.string_hash(str(key)) % capacity
+
+    def getChainHistogram(self):
+        """
+        Returns a list whose entry k is the number of buckets holding k records (over both
+        bucket arrays while an incremental resize is migrating). Chaining storage only.
+        """
+        if self.storage != "chaining":
+            raise ValueError("Chain histogram requires chaining storage; use getProbeHistogram.")
+        histogram = [0]
+        for table in (self.table, self.old_table):
+            if table is None:
+                continue
+            for chain in table:
+                length = 0 if chain is None else len(chain)
+                while length >= len(histogram):
+                    histogram.append(0)
+                histogram[length] += 1
+        if self.old_table is not None: # Migrated old buckets are empty placeholders, not real buckets
+            histogram[0] -= self.migrate_index
+        return histogram
+
+    def getProbeHistogram(self):
+        """
+        Returns a list whose entry k is the number of records a successful search reaches
+        after k hops (chain position, or slots probed for robin_hood). Works for both storages.
+        """
+        histogram = [0]
+        def Count(hops):
+            while hops >= len(histogram):
+                histogram.append(0)
+            histogram[hops] += 1
+
+        if self.storage == "robin_hood":
+            for dist in self.slot_dists:
+                if dist >= 0:
+                    Count(dist + 1)
+            return histogram
+        for table in (self.table, self.old_table):
+            if table is None:
+                continue
+            for chain in table:
+                if chain is not None:
+                    for position in range(1, len(chain) + 1):
+                        Count(position)
+        return histogram
     
+    def FindBucket(self, key):
+        """
+        Returns (table, index) of the bucket that holds key: the old table while an
+        incremental resize has not migrated that bucket yet, otherwise the current one.
+        """
+        if self.old_table is not None:
+            old_index = self.Hash(key, self.old_capacity)
+            if old_index >= self.migrate_index:
+                return self.old_table, old_index
+        return self.table, self.Hash(key)
+
     ## 2) Core operations
     def insert(self, record):
         """Inserts a PatientRecord into the hash table. Handles duplicates by updating."""
+        if self.storage == "robin_hood":
+            return self.RobinHoodInsert(record)
+        self.MigrateStep()
         if self.getLoadFactor() > self.max_load_factor:
             self.Resize()
 
-        index = self.Hash(record.patientID)
-        chain = self.table[index]
+        table, index = self.FindBucket(record.patientID)
+        chain = table[index]
+        if chain is None:
+            chain = table[index] = DSALinkedList()
         op_count = 0
 
-        # Check for duplicates
-        for existing_record in chain:
+        # Check for duplicates, walking the nodes directly
+        node = chain.head
+        while node is not None:
             op_count += 1
+            existing_record = node.value
             if existing_record.patientID == record.patientID: # Update existing record
-                existing_record.name = record.name
-                existing_record.age = record.age
-                existing_record.department = record.department
-                existing_record.urgencyLevel = record.urgencyLevel
-                existing_record.treatmentStatus = record.treatmentStatus
-                print(f"UPDATE: Patient {record.patientID} updated. (Chain traversal: {op_count} hops)", flush=True)
+                self.UpdateRecord(existing_record, record)
+                if self.verbose:
+                    print(f"UPDATE: Patient {record.patientID} updated. (Chain traversal: {op_count} hops)", flush=True)
+                if self.trace is not None:
+                    self.trace("update", record.patientID, index, op_count)
                 return
+            node = node.next
 
         # No duplicate found, insert new record
         chain.insertLast(record)
         self.count += 1
-        print(f"INSERT: Patient {record.patientID} into index {index}. (Chain length: {len(chain)})", flush=True)
+        if self.verbose:
+            print(f"INSERT: Patient {record.patientID} into index {index}. (Chain length: {len(chain)})", flush=True)
+        if self.trace is not None:
+            self.trace("insert", record.patientID, index, op_count)
 
     def search(self, patientID):
         """Searches for a patient by their ID and returns the full record."""
         ## search(patientID): O(1) expected; return the full patient record or a not-found message. 
-        index = self.Hash(patientID)
-        chain = self.table[index]
+        if self.storage == "robin_hood":
+            return self.RobinHoodSearch(patientID)
+        self.MigrateStep()
+        table, index = self.FindBucket(patientID)
+        chain = table[index]
         op_count = 0
 
-        for record in chain:
+        node = chain.head if chain is not None else None
+        while node is not None:
             op_count += 1
+            record = node.value
             if record.patientID == patientID:
-                print(f"Found Patient {patientID} at index {index}. (Chain traversal: {op_count} hops)", flush=True)
+                if self.verbose:
+                    print(f"Found Patient {patientID} at index {index}. (Chain traversal: {op_count} hops)", flush=True)
+                if self.trace is not None:
+                    self.trace("hit", patientID, index, op_count)
                 return record
+            node = node.next
         
-        print(f"SEARCH MISS: Patient {patientID} not found. (Chain traversal: {op_count} hops)", flush=True)
+        if self.verbose:
+            print(f"SEARCH MISS: Patient {patientID} not found. (Chain traversal: {op_count} hops)", flush=True)
+        if self.trace is not None:
+            self.trace("miss", patientID, index, op_count)
         return None
 
     def delete(self, patientID):
         """Deletes a patient record by their ID."""
-        index = self.Hash(patientID)
-        chain = self.table[index]
+        if self.storage == "robin_hood":
+            return self.RobinHoodDelete(patientID)
+        self.MigrateStep()
+        table, index = self.FindBucket(patientID)
+        chain = table[index]
+
+        op_count = 0
+        if self.trace is not None and chain is not None: # Hops are only counted for the trace hook
+            for record in chain:
+                op_count += 1
+                if record.patientID == patientID:
+                    break
 
-        removed_record = chain.removeByPatientID(patientID)
+        removed_record = chain.removeByPatientID(patientID) if chain is not None else None
 
         if removed_record:
             self.count -= 1
-            print(f"DELETE: Successfully removed Patient {patientID} from index {index}.", flush=True)
+            if self.verbose:
+                print(f"DELETE: Successfully removed Patient {patientID} from index {index}.", flush=True)
+            if self.trace is not None:
+                self.trace("delete", patientID, index, op_count)
+        else:
+            if self.verbose:
+                print(f"DELETE FAIL: Patient {patientID} not found, nothing to delete.", flush=True)
+            if self.trace is not None:
+                self.trace("delete_miss", patientID, index, op_count)
+
+    def bulkLoad(self, source, expected=None):
+        """
+        Loads many patients in one pass. source is an iterable of PatientRecords or the path
+        (str or os.PathLike) of a CSV in the patients.csv format. The rows are counted first
+        (newlines, for a file; len() or its length hint for an iterable), the table is grown
+        once to a prime capacity that holds them all under max_load_factor, and the records
+        are then inserted without per-record logging. A generator is never copied to count it:
+        pass expected= with a row count or estimate to presize for one, otherwise the table
+        grows by its usual resizes. Duplicate IDs still update the stored record and invalid
+        CSV rows are skipped. Returns (loaded, skipped).
+        """
+        if isinstance(source, (str, os.PathLike)):
+            source = os.fspath(source)
+            if expected is None:
+                expected = CountCsvRows(source)
+            records = ReadPatientCsv(source)
         else:
-            print(f"DELETE FAIL: Patient {patientID} not found, nothing to delete.", flush=True)
+            if expected is None:
+                expected = operator.length_hint(source, 0) # 0 for a plain generator
+            records = source
+
+        start_capacity = self.capacity
+        loaded = skipped = 0
+        verbose, self.verbose = self.verbose, False
+        try:
+            needed = self.FindNextPrime(int((self.count + expected) / self.max_load_factor) + 1)
+            if needed > self.capacity:
+                self.Resize(needed)
+            for record in records:
+                if record is None:
+                    skipped += 1
+                    continue
+                self.insert(record)
+                loaded += 1
+        finally:
+            self.verbose = verbose
+
+        if verbose:
+            print(f"BULK LOAD: {loaded} records loaded, {skipped} rows skipped. "
+                  f"Capacity {start_capacity} -> {self.capacity}, load factor {self.getLoadFactor():.2f}.", flush=True)
+        return loaded, skipped
 
     def getLoadFactor(self):
         """Calculates the current load factor of the hash table."""
@@ -170,9 +442,16 @@ class DSAHashTable:
         # Start with a header
         string_builder = "\n" + "="*25 + " HASH TABLE " + "="*25 + "\n"
         string_builder += f"Count: {self.count}, Capacity: {self.capacity}, Load Factor: {self.getLoadFactor():.2f}\n"
+
+        if self.storage == "robin_hood": # One record per slot, with its distance from the home slot
+            for i in range(self.capacity):
+                if self.slot_dists[i] >= 0:
+                    string_builder += f"Index {i:02}: [ID: {self.slot_keys[i]}] (probe distance {self.slot_dists[i]})\n"
+            string_builder += "="*70 + "\n"
+            return string_builder
         
         for i, chain in enumerate(self.table):
-            if len(chain) > 0:
+            if chain is not None and len(chain) > 0:
                 # Build the chain string
                 chain_str = ""
                 for record in chain:
@@ -180,28 +459,220 @@ class DSAHashTable:
                 
                 # Add the full line to the master string
                 string_builder += f"Index {i:02}: {chain_str}None\n"
+
+        if self.old_table is not None: # Buckets an incremental resize has not moved yet
+            string_builder += f"Resizing from {self.old_capacity}: {self.migrate_index} of {self.old_capacity} old buckets migrated\n"
+            for i in range(self.migrate_index, self.old_capacity):
+                chain = self.old_table[i]
+                if chain is not None and len(chain) > 0:
+                    chain_str = ""
+                    for record in chain:
+                        chain_str += f"[ID: {record.patientID}] -> "
+                    string_builder += f"Old {i:02}: {chain_str}None\n"
         
         string_builder += "="*70 + "\n"
         return string_builder
 
     # private methods
-    def Resize(self):
-        """Doubles the hash table size and re-hashes all existing entries."""
+    def UpdateRecord(self, existing_record, record):
+        """Copies the fields of a duplicate insert onto the stored record."""
+        existing_record.name = record.name
+        existing_record.age = record.age
+        existing_record.department = record.department
+        existing_record.urgencyLevel = record.urgencyLevel
+        existing_record.treatmentStatus = record.treatmentStatus
+
+    def Resize(self, new_capacity=None):
+        """
+        Doubles the hash table size (or grows it to new_capacity, which should be prime).
+        Normally re-hashes all existing entries at once; with incremental_resize it only swaps
+        in the new bucket array and leaves the old one for MigrateStep to drain.
+        """
         old_table = self.table
-        new_capacity = self.FindNextPrime(self.capacity * 2)
+        if new_capacity is None:
+            new_capacity = self.FindNextPrime(self.capacity * 2)
         
-        print(f"\nRESIZING: Load factor > {self.max_load_factor}. "
-              f"Resizing from {self.capacity} to {new_capacity}.\n", flush=True)
+        if self.verbose:
+            print(f"\nRESIZING: Load factor > {self.max_load_factor}. "
+                  f"Resizing from {self.capacity} to {new_capacity}.\n", flush=True)
+        if self.trace is not None:
+            self.trace("resize", None, new_capacity, 0)
+
+        if self.storage == "robin_hood": # Quiet re-placement into fresh slot arrays
+            old_keys, old_records, old_dists = self.slot_keys, self.slot_records, self.slot_dists
+            self.capacity = new_capacity
+            self.AllocateSlots()
+            for i in range(len(old_dists)):
+                if old_dists[i] >= 0:
+                    key = old_keys[i]
+                    self.PlaceRecord(key, old_records[i], self.Hash(key), 0)
+            return
+
+        if self.incremental_resize:
+            if self.old_table is not None: # Previous resize still migrating; finish it first
+                self.MigrateStep(self.old_capacity)
+            self.old_table, self.old_capacity = self.table, self.capacity
+            self.migrate_index = 0
+            self.capacity = new_capacity
+            self.table = [None] * self.capacity
+            return
 
         # Reset the current table
         self.capacity = new_capacity
-        self.table = [DSALinkedList() for _ in range(self.capacity)] # 
+        self.table = [None] * self.capacity
         self.count = 0
 
-        # Re-hash all records from the old table
+        # Re-hash all records from the old table (not traced: they are not new inserts)
+        trace, self.trace = self.trace, None
         for chain in old_table:
-            for record in chain:
-                self.insert(record)
+            if chain is not None:
+                for record in chain:
+                    self.insert(record)
+        self.trace = trace
+
+    def MigrateStep(self, steps=None):
+        """
+        Moves the next 'steps' buckets (default migrate_step) of an incremental resize into
+        the new table, without logging or duplicate checks. Drops the old table when done.
+        """
+        if self.old_table is None:
+            return
+        if steps is None:
+            steps = self.migrate_step
+        stop = min(self.migrate_index + steps, self.old_capacity)
+        for old_index in range(self.migrate_index, stop):
+            chain = self.old_table[old_index]
+            if chain is not None:
+                for record in chain:
+                    index = self.Hash(record.patientID)
+                    new_chain = self.table[index]
+                    if new_chain is None:
+                        new_chain = self.table[index] = DSALinkedList()
+                    new_chain.insertLast(record)
+                self.old_table[old_index] = None
+        self.migrate_index = stop
+        if stop == self.old_capacity:
+            self.old_table = None
+
+    # Robin Hood open addressing (storage="robin_hood")
+    def AllocateSlots(self):
+        """Creates empty slot arrays for the current capacity; a probe distance of -1 marks an empty slot."""
+        self.slot_keys = [None] * self.capacity
+        self.slot_records = [None] * self.capacity
+        self.slot_dists = array('h', [-1]) * self.capacity
+
+    def RobinHoodFind(self, key):
+        """
+        Probes for key from its home slot. Returns (index, dist, home): index is -1 if the
+        key is absent, which is certain once a slot sits closer to its own home than we are.
+        """
+        keys, dists = self.slot_keys, self.slot_dists
+        capacity = self.capacity
+        home = index = self.Hash(key)
+        dist = 0
+        while dists[index] >= dist:
+            if keys[index] == key:
+                return index, dist, home
+            dist += 1
+            index += 1
+            if index == capacity:
+                index = 0
+        return -1, dist, home
+
+    def PlaceRecord(self, key, record, index, dist):
+        """
+        Stores a new key at probe distance dist from slot index onwards. Whenever the
+        resident of a slot is closer to its home than the carried record, they swap and
+        the displaced record continues the probe (Robin Hood: take from the rich).
+        """
+        keys, records, dists = self.slot_keys, self.slot_records, self.slot_dists
+        capacity = self.capacity
+        while True:
+            slot_dist = dists[index]
+            if slot_dist == -1:
+                keys[index] = key
+                records[index] = record
+                dists[index] = dist
+                return
+            if slot_dist < dist:
+                keys[index], key = key, keys[index]
+                records[index], record = record, records[index]
+                dists[index], dist = dist, slot_dist
+            dist += 1
+            index += 1
+            if index == capacity:
+                index = 0
+
+    def RobinHoodInsert(self, record):
+        """insert() for open-addressing storage."""
+        if (self.count + 1) / self.capacity > self.max_load_factor: # Always keep an empty slot to end probes
+            self.Resize()
+
+        key = record.patientID
+        index, dist, home = self.RobinHoodFind(key)
+        if index != -1: # Update existing record
+            self.UpdateRecord(self.slot_records[index], record)
+            if self.verbose:
+                print(f"UPDATE: Patient {key} updated. (Probes: {dist + 1})", flush=True)
+            if self.trace is not None:
+                self.trace("update", key, index, dist + 1)
+            return
+
+        # The probe stopped at the first slot the new record may claim
+        index = (home + dist) % self.capacity
+        self.PlaceRecord(key, record, index, dist)
+        self.count += 1
+        if self.verbose:
+            print(f"INSERT: Patient {key} into index {index}. (Probe distance: {dist})", flush=True)
+        if self.trace is not None:
+            self.trace("insert", key, index, dist + 1)
+
+    def RobinHoodSearch(self, patientID):
+        """search() for open-addressing storage."""
+        index, dist, home = self.RobinHoodFind(patientID)
+        if index != -1:
+            if self.verbose:
+                print(f"Found Patient {patientID} at index {index}. (Probes: {dist + 1})", flush=True)
+            if self.trace is not None:
+                self.trace("hit", patientID, index, dist + 1)
+            return self.slot_records[index]
+
+        if self.verbose:
+            print(f"SEARCH MISS: Patient {patientID} not found. (Probes: {dist + 1})", flush=True)
+        if self.trace is not None:
+            self.trace("miss", patientID, home, dist + 1)
+        return None
+
+    def RobinHoodDelete(self, patientID):
+        """delete() for open-addressing storage: backward-shift deletion, no tombstones."""
+        index, dist, home = self.RobinHoodFind(patientID)
+        if index == -1:
+            if self.verbose:
+                print(f"DELETE FAIL: Patient {patientID} not found, nothing to delete.", flush=True)
+            if self.trace is not None:
+                self.trace("delete_miss", patientID, home, dist + 1)
+            return
+
+        keys, records, dists = self.slot_keys, self.slot_records, self.slot_dists
+        capacity = self.capacity
+        removed_index = index
+        # Pull each following displaced record one slot back towards its home
+        next_index = index + 1 if index + 1 < capacity else 0
+        while dists[next_index] > 0:
+            keys[index] = keys[next_index]
+            records[index] = records[next_index]
+            dists[index] = dists[next_index] - 1
+            index = next_index
+            next_index = index + 1 if index + 1 < capacity else 0
+        keys[index] = None
+        records[index] = None
+        dists[index] = -1
+        self.count -= 1
+
+        if self.verbose:
+            print(f"DELETE: Successfully removed Patient {patientID} from index {removed_index}.", flush=True)
+        if self.trace is not None:
+            self.trace("delete", patientID, removed_index, dist + 1)
 
     def FindNextPrime(self, start_val):
         """Finds the next prime number from a given starting value."""
@@ -229,7 +700,7 @@ def main():
     expected_output.append("###   MODULE 2: Hash-Based Patient Lookup   ###")
     expected_output.append("#"*47)
 
-    patient_table = DSAHashTable(initial_size=11) # small prime number
+    patient_table = DSAHashTable(initial_size=11, int_fast_path=False) # small prime number; string hash for the collision demo
 
     # input files
     input_dir = "input" # Assuming 'input' directory from Module 3
@@ -246,14 +717,7 @@ def main():
             reader = csv.DictReader(file)
             for row in reader:
                 try:
-                    new_patient = PatientRecord(
-                        patientID=int(row['patient_id']),
-                        name=row['name'],
-                        age=int(row['age']),
-                        department=row['department'],
-                        urgencyLevel=int(row['urgency_level']), 
-                        treatmentStatus=row['treatment_status'] 
-                    )
+                    new_patient = PatientRecord.fromCsvRow(row)
                     # We capture the log from the insert method (if you add logging)
                     # Note: Our new insert() prints directly, so insert_log will be None.
                     # This is fine. We just call the method.
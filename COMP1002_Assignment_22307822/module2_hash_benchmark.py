@@ -0,0 +1,133 @@
+# MODULE 2 BENCHMARK: Hash Function Speed and Distribution Quality
+# Author: Thejana Kottawatta (22307822)
+
+import time
+import math
+import random
+import os
+from module2_hash import DSAHashTable, PatientRecord, PolynomialHash, Crc32Hash
+
+class HashBenchmark:
+    """Loads the same patient ID sets with each hash function and compares speed and chain lengths."""
+    def __init__(self):
+        self.results = []
+
+    def Run(self, hash_name, set_name, patient_ids, table_options):
+        """
+        Times table.Hash over every ID, then a quiet load and one search per ID, and reads
+        the chain-length histogram of the loaded table.
+        """
+        table = DSAHashTable(initial_size=11, verbose=False, **table_options)
+        records = [PatientRecord(patient_id, "Patient", 40, "Wards", 3) for patient_id in patient_ids]
+
+        start_time = time.perf_counter()
+        for patient_id in patient_ids:
+            table.Hash(patient_id)
+        hash_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for record in records:
+            table.insert(record)
+        insert_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for patient_id in patient_ids:
+            table.search(patient_id)
+        search_seconds = time.perf_counter() - start_time
+
+        histogram = table.getChainHistogram()
+        # Average records compared by a successful search: a chain of length L costs 1+2+...+L in total
+        total_hops = sum(length * (length + 1) // 2 * buckets for length, buckets in enumerate(histogram))
+        self.results.append({
+            "Hash": hash_name,
+            "IDs": set_name,
+            "Hash (M/s)": len(patient_ids) / hash_seconds / 1e6,
+            "Insert/s": len(patient_ids) / insert_seconds,
+            "Search/s": len(patient_ids) / search_seconds,
+            "Empty %": histogram[0] * 100 / table.capacity,
+            "Max chain": len(histogram) - 1,
+            "Avg hops": total_hops / table.count,
+            "Histogram": histogram,
+            "Load": table.getLoadFactor()})
+
+    def DisplayResults(self):
+        """Builds the benchmark results table as a list of strings."""
+        output = []
+
+        table_width = 124
+        header = "\n" + "="*table_width
+        header += "\n--- Hash Function Benchmark Results ---"
+        header += "\n" + "="*table_width
+        output.append(header)
+
+        cols = f"{'Hash':<10} | {'IDs':<10} | {'Hash (M/s)':<10} | {'Insert/s':<8} | {'Search/s':<8} | " \
+               f"{'Empty %':<7} | {'Max chain':<9} | {'Avg hops':<8} | {'Buckets with 1 / 2 / 3 / 4+ records'}"
+        output.append(cols)
+        output.append("-"*table_width)
+
+        for res in self.results:
+            histogram = res['Histogram'] + [0] * 4
+            buckets_str = f"{histogram[1]} / {histogram[2]} / {histogram[3]} / {sum(histogram[4:])}"
+            row = f"{res['Hash']:<10} | {res['IDs']:<10} | {res['Hash (M/s)']:<10.2f} | {res['Insert/s']:<8.0f} | " \
+                  f"{res['Search/s']:<8.0f} | {res['Empty %']:<7.1f} | {res['Max chain']:<9} | " \
+                  f"{res['Avg hops']:<8.3f} | {buckets_str}"
+            output.append(row)
+
+        output.append("="*table_width)
+        return output
+
+def main():
+    """Benchmark driver"""
+    file_output = []
+
+    Seed = 41
+    size = 200000
+    random.seed(Seed)
+    site_size = size // 8
+    id_sets = [
+        ("Sequential", list(range(100000, 100000 + size))), # One admissions counter
+        ("Random", random.sample(range(1, 10**9), size)),
+        ("Site-coded", [site * 10**7 + seq for site in range(1, 9) for seq in range(1, site_size + 1)]), # 8 sites, own counters
+        ("Stride 100", [100 * i for i in range(1, size + 1)])] # IDs handed out in blocks of 100
+    hash_functions = [
+        ("Polynomial", {"int_fast_path": False, "string_hash": PolynomialHash}),
+        ("CRC-32", {"int_fast_path": False, "string_hash": Crc32Hash}),
+        ("Fibonacci", {"int_fast_path": True})]
+
+    benchmark = HashBenchmark()
+
+    file_output.append("#"*45)
+    file_output.append("###   MODULE 2: Hash Function Benchmark   ###")
+    file_output.append("#"*45)
+
+    for set_name, patient_ids in id_sets:
+        for hash_name, table_options in hash_functions:
+            print(f"Running {hash_name} on {set_name} IDs...")
+            benchmark.Run(hash_name, set_name, patient_ids, table_options)
+
+    load = benchmark.results[0]["Load"]
+    file_output.extend(benchmark.DisplayResults())
+    file_output.append("\nNotes:")
+    file_output.append(f" - {size} patient IDs per set; every table grows from capacity 11 to the same final")
+    file_output.append(f"   capacity (load factor {load:.2f}), so the histograms are directly comparable.")
+    file_output.append(f" - A uniform hash would leave about {100 * math.exp(-load):.1f}% of buckets empty and need")
+    file_output.append(f"   about {1 + load / 2:.3f} hops per successful search (1 + load/2).")
+    file_output.append(" - 'Hash (M/s)' is DSAHashTable.Hash alone; Polynomial and CRC-32 hash str(patientID),")
+    file_output.append("   Fibonacci is the integer fast path (multiply by 2^64/phi, scale into the table).")
+
+    final_output_string = "\n".join(file_output)
+    print(final_output_string)
+
+    output_dir = "output"
+    output_file = os.path.join(output_dir, "2hash_benchmark_results.txt")
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(final_output_string)
+        print(f"\nBenchmark complete. Results also saved to {output_file}")
+    except Exception as e:
+        print(f"\nError: Could not save results file to {output_file}")
+        print(f"Details: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# MODULE 2 BENCHMARK: Hash Table Throughput With and Without Logging/Tracing
+# Author: Thejana Kottawatta (22307822)
+
+import time
+import random
+import os
+from contextlib import redirect_stdout
+from module2_hash import DSAHashTable, DSAHashStats, PatientRecord
+
+class ThroughputBenchmark:
+    """Measures insert/search/delete operations per second for each DSAHashTable output mode."""
+    def __init__(self, seed):
+        self.seed = seed
+        self.results = []
+
+    def Run(self, mode_name, size, verbose, traced):
+        """
+        Inserts 'size' patients, searches each of them, searches 'size' absent IDs and
+        deletes every patient again, timing each phase. Returns the DSAHashStats sink
+        (or None when untraced).
+        """
+        random.seed(self.seed + size)
+        patient_ids = random.sample(range(1, size * 10), size * 2)
+        present_ids, absent_ids = patient_ids[:size], patient_ids[size:]
+        records = [PatientRecord(patient_id, f"Patient {patient_id}", 40, "Wards", 3) for patient_id in present_ids]
+        stats = DSAHashStats() if traced else None
+        table = DSAHashTable(initial_size=11, verbose=verbose, trace=stats)
+
+        phases = [("Insert", table.insert, records), ("Search hit", table.search, present_ids),
+                  ("Search miss", table.search, absent_ids), ("Delete", table.delete, present_ids)]
+        row = {"Mode": mode_name, "Size": size}
+        with open(os.devnull, 'w') as sink, redirect_stdout(sink): # Logging mode still pays for formatting and writing
+            for phase_name, operation, arguments in phases:
+                start_time = time.perf_counter()
+                for argument in arguments:
+                    operation(argument)
+                row[phase_name] = len(arguments) / (time.perf_counter() - start_time)
+        self.results.append(row)
+        return stats
+
+    def DisplayResults(self):
+        """Builds the benchmark results table as a list of strings."""
+        output = []
+
+        table_width = 90
+        header = "\n" + "="*table_width
+        header += "\n--- Hash Table Throughput Benchmark Results (operations/sec) ---"
+        header += "\n" + "="*table_width
+        output.append(header)
+
+        cols = f"{'Mode':<14} | {'Size':<7} | {'Insert':<12} | {'Search hit':<12} | {'Search miss':<12} | {'Delete'}"
+        output.append(cols)
+        output.append("-"*table_width)
+
+        for res in self.results:
+            row = f"{res['Mode']:<14} | {res['Size']:<7} | {res['Insert']:<12.0f} | {res['Search hit']:<12.0f} | " \
+                  f"{res['Search miss']:<12.0f} | {res['Delete']:.0f}"
+            output.append(row)
+
+        output.append("="*table_width)
+        return output
+
+def main():
+    """Benchmark driver"""
+    file_output = []
+
+    Seed = 41
+    sizes = [10**5, 10**6]
+    modes = [("Logging", True, False), ("Quiet", False, False), ("Quiet + stats", False, True)]
+
+    benchmark = ThroughputBenchmark(Seed)
+
+    file_output.append("#"*53)
+    file_output.append("###   MODULE 2: Hash Table Throughput Benchmark   ###")
+    file_output.append("#"*53)
+
+    for size in sizes:
+        for mode_name, verbose, traced in modes:
+            print(f"Running {mode_name} with {size} patients...")
+            stats = benchmark.Run(mode_name, size, verbose, traced)
+            if stats is not None:
+                file_output.append(f"Size {size} trace: {stats}")
+
+    file_output.extend(benchmark.DisplayResults())
+    file_output.append("\nNotes:")
+    file_output.append(" - 'Logging' is the default verbose=True table with its output sent to os.devnull;")
+    file_output.append("   printing to a terminal or file is slower still.")
+    file_output.append(" - 'Quiet' is verbose=False with no trace hook; 'Quiet + stats' passes a DSAHashStats")
+    file_output.append("   counter sink as trace=, which receives every event and its chain hops.")
+    file_output.append(" - Every table starts at capacity 11 and grows through the usual resizes.")
+
+    final_output_string = "\n".join(file_output)
+    print(final_output_string)
+
+    output_dir = "output"
+    output_file = os.path.join(output_dir, "2ops_benchmark_results.txt")
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(final_output_string)
+        print(f"\nBenchmark complete. Results also saved to {output_file}")
+    except Exception as e:
+        print(f"\nError: Could not save results file to {output_file}")
+        print(f"Details: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# MODULE 2 BENCHMARK: Stop-the-World vs Incremental Resizing
+# Author: Thejana Kottawatta (22307822)
+
+import time
+import random
+import os
+import gc
+from module2_hash import DSAHashTable, PatientRecord
+
+class ResizeBenchmark:
+    """Measures the per-operation latency of DSAHashTable under both resize modes."""
+    def __init__(self, seed):
+        self.seed = seed
+        self.results = []
+
+    def Run(self, mode_name, incremental, size):
+        """
+        Inserts 'size' patients with unique random IDs into a table starting at capacity 11,
+        then searches each of them once, timing every operation on its own.
+        """
+        random.seed(self.seed + size)
+        patient_ids = random.sample(range(1, size * 10), size)
+        records = [PatientRecord(patient_id, f"Patient {patient_id}", 40, "Wards", 3) for patient_id in patient_ids]
+        table = DSAHashTable(initial_size=11, incremental_resize=incremental, verbose=False)
+        insert_ns = []
+        search_ns = []
+        clock = time.perf_counter_ns
+
+        gc.disable() # Keep collector pauses out of the per-operation timings
+        start_time = time.perf_counter()
+        for record in records:
+            op_start = clock()
+            table.insert(record)
+            insert_ns.append(clock() - op_start)
+        for patient_id in patient_ids:
+            op_start = clock()
+            table.search(patient_id)
+            search_ns.append(clock() - op_start)
+        total_ms = (time.perf_counter() - start_time) * 1000
+        gc.enable()
+
+        insert_ns.sort()
+        search_ns.sort()
+        self.results.append({
+            "Mode": mode_name,
+            "Size": size,
+            "Total (ms)": total_ms,
+            "Insert p99 (us)": insert_ns[int(len(insert_ns) * 0.99)] / 1000,
+            "Insert max (ms)": insert_ns[-1] / 1e6,
+            "Search p99 (us)": search_ns[int(len(search_ns) * 0.99)] / 1000,
+            "Search max (ms)": search_ns[-1] / 1e6,
+            "Capacity": table.capacity})
+
+    def DisplayResults(self):
+        """Builds the benchmark results table as a list of strings."""
+        output = []
+
+        table_width = 107
+        header = "\n" + "="*table_width
+        header += "\n--- Hash Table Resize Latency Benchmark Results ---"
+        header += "\n" + "="*table_width
+        output.append(header)
+
+        cols = f"{'Mode':<11} | {'Size':<7} | {'Total (ms)':<10} | {'Insert p99 (us)':<15} | {'Insert max (ms)':<15} | " \
+               f"{'Search p99 (us)':<15} | {'Search max (ms)':<15} | {'Capacity'}"
+        output.append(cols)
+        output.append("-"*table_width)
+
+        for res in self.results:
+            row = f"{res['Mode']:<11} | {res['Size']:<7} | {res['Total (ms)']:<10.0f} | " \
+                  f"{res['Insert p99 (us)']:<15.1f} | {res['Insert max (ms)']:<15.2f} | " \
+                  f"{res['Search p99 (us)']:<15.1f} | {res['Search max (ms)']:<15.2f} | {res['Capacity']}"
+            output.append(row)
+
+        output.append("="*table_width)
+        return output
+
+def main():
+    """Benchmark driver"""
+    file_output = []
+
+    Seed = 41
+    sizes = [10**4, 10**5, 10**6]
+
+    benchmark = ResizeBenchmark(Seed)
+
+    file_output.append("#"*57)
+    file_output.append("###   MODULE 2: Hash Table Resize Latency Benchmark   ###")
+    file_output.append("#"*57)
+
+    for size in sizes:
+        for mode_name, incremental in [("Rehash all", False), ("Incremental", True)]:
+            print(f"Running {mode_name} with {size} patients...")
+            benchmark.Run(mode_name, incremental, size)
+
+    file_output.extend(benchmark.DisplayResults())
+    file_output.append("\nNotes:")
+    file_output.append(" - Every operation is timed on its own, on a quiet (verbose=False) table.")
+    file_output.append(" - 'Rehash all' re-inserts every record inside the insert that crosses the load")
+    file_output.append("   factor, so its worst insert grows with the table. 'Incremental' keeps both bucket")
+    file_output.append("   arrays and migrates a few old buckets per insert/search/delete instead; its")
+    file_output.append("   remaining spike is allocating the new (empty) bucket array.")
+    file_output.append(" - The price is a higher p99 while a migration is running: each operation also")
+    file_output.append("   re-hashes the records of its migrate_step old buckets.")
+    file_output.append(" - The garbage collector is disabled while timing.")
+
+    final_output_string = "\n".join(file_output)
+    print(final_output_string)
+
+    output_dir = "output"
+    output_file = os.path.join(output_dir, "2resize_benchmark_results.txt")
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(final_output_string)
+        print(f"\nBenchmark complete. Results also saved to {output_file}")
+    except Exception as e:
+        print(f"\nError: Could not save results file to {output_file}")
+        print(f"Details: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# MODULE 2 BENCHMARK: Separate Chaining vs Robin Hood Open Addressing
+# Author: Thejana Kottawatta (22307822)
+
+import time
+import random
+import os
+import gc
+import tracemalloc
+from module2_hash import DSAHashTable, PatientRecord
+
+class StorageBenchmark:
+    """Compares the memory and lookup latency of the two DSAHashTable storage engines."""
+    def __init__(self, seed):
+        self.seed = seed
+        self.results = []
+
+    def Run(self, storage, size):
+        """
+        Loads 'size' patients with random IDs under tracemalloc (the records themselves are
+        built beforehand, so only the table's own structures are counted), then times one
+        search per patient and as many searches for absent IDs, each on its own.
+        """
+        random.seed(self.seed + size)
+        patient_ids = random.sample(range(1, size * 20), size * 2)
+        present_ids, absent_ids = patient_ids[:size], patient_ids[size:]
+        records = [PatientRecord(patient_id, f"Patient {patient_id}", 40, "Wards", 3) for patient_id in present_ids]
+
+        tracemalloc.start()
+        table = DSAHashTable(initial_size=11, verbose=False, storage=storage)
+        for record in records:
+            table.insert(record)
+        table_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        clock = time.perf_counter_ns
+        hit_ns = []
+        miss_ns = []
+        gc.disable() # Keep collector pauses out of the per-operation timings
+        for patient_id in present_ids:
+            op_start = clock()
+            table.search(patient_id)
+            hit_ns.append(clock() - op_start)
+        for patient_id in absent_ids:
+            op_start = clock()
+            table.search(patient_id)
+            miss_ns.append(clock() - op_start)
+        gc.enable()
+
+        hit_ns.sort()
+        miss_ns.sort()
+        histogram = table.getProbeHistogram()
+        self.results.append({
+            "Storage": storage,
+            "Size": size,
+            "Capacity": table.capacity,
+            "Load": table.getLoadFactor(),
+            "Bytes/record": table_bytes / size,
+            "Avg hops": sum(hops * records for hops, records in enumerate(histogram)) / size,
+            "Max hops": len(histogram) - 1,
+            "Hit p50 (us)": hit_ns[len(hit_ns) // 2] / 1000,
+            "Hit p99 (us)": hit_ns[int(len(hit_ns) * 0.99)] / 1000,
+            "Miss p99 (us)": miss_ns[int(len(miss_ns) * 0.99)] / 1000})
+
+    def DisplayResults(self):
+        """Builds the benchmark results table as a list of strings."""
+        output = []
+
+        table_width = 123
+        header = "\n" + "="*table_width
+        header += "\n--- Hash Table Storage Benchmark Results ---"
+        header += "\n" + "="*table_width
+        output.append(header)
+
+        cols = f"{'Storage':<10} | {'Size':<7} | {'Capacity':<8} | {'Load':<4} | {'Bytes/record':<12} | {'Avg hops':<8} | " \
+               f"{'Max hops':<8} | {'Hit p50 (us)':<12} | {'Hit p99 (us)':<12} | {'Miss p99 (us)'}"
+        output.append(cols)
+        output.append("-"*table_width)
+
+        for res in self.results:
+            row = f"{res['Storage']:<10} | {res['Size']:<7} | {res['Capacity']:<8} | {res['Load']:<4.2f} | " \
+                  f"{res['Bytes/record']:<12.1f} | {res['Avg hops']:<8.3f} | {res['Max hops']:<8} | " \
+                  f"{res['Hit p50 (us)']:<12.2f} | {res['Hit p99 (us)']:<12.2f} | {res['Miss p99 (us)']:.2f}"
+            output.append(row)
+
+        output.append("="*table_width)
+        return output
+
+def main():
+    """Benchmark driver"""
+    file_output = []
+
+    Seed = 41
+    sizes = [10**4, 10**5, 10**6]
+    storages = ["chaining", "robin_hood"]
+
+    benchmark = StorageBenchmark(Seed)
+
+    file_output.append("#"*50)
+    file_output.append("###   MODULE 2: Hash Table Storage Benchmark   ###")
+    file_output.append("#"*50)
+
+    for size in sizes:
+        for storage in storages:
+            print(f"Running {storage} with {size} patients...")
+            benchmark.Run(storage, size)
+
+    file_output.extend(benchmark.DisplayResults())
+    file_output.append("\nNotes:")
+    file_output.append(" - 'Bytes/record' is the table's own memory (tracemalloc) divided by the records held;")
+    file_output.append("   the PatientRecord objects are shared by both engines and not counted.")
+    file_output.append(" - chaining: one DSALinkedList plus one node per record, resized above load 0.7.")
+    file_output.append("   robin_hood: three flat slot arrays (keys, records, 16-bit probe distances), resized")
+    file_output.append("   above load 0.85; 'hops' are slots probed.")
+    file_output.append(" - Searches are timed one by one with the garbage collector disabled; p99 is the")
+    file_output.append("   99th-percentile single lookup.")
+
+    final_output_string = "\n".join(file_output)
+    print(final_output_string)
+
+    output_dir = "output"
+    output_file = os.path.join(output_dir, "2storage_benchmark_results.txt")
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(final_output_string)
+        print(f"\nBenchmark complete. Results also saved to {output_file}")
+    except Exception as e:
+        print(f"\nError: Could not save results file to {output_file}")
+        print(f"Details: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -10,12 +10,15 @@ from contextlib import redirect_stdout
 class DSALinkedList:
     """Linked List from previous modules, adapted to store PatientRecord objects for hash table chaining."""
     class DSAListNode:
+        __slots__ = ("value", "next") # No per-node __dict__, nodes are much smaller
+
         def __init__(self, value):
             self.value = value
             self.next = None
 
     def __init__(self):
         self.head = None
+        self.tail = None # Tail pointer so insertLast doesn't have to walk the chain
         self.count = 0
 
     def insertLast(self, value):
@@ -23,10 +26,8 @@ class DSALinkedList:
         if self.head is None:
             self.head = newNode
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = newNode
+            self.tail.next = newNode
+        self.tail = newNode
         self.count += 1
 
     def removeByPatientId(self, patient_id):
@@ -39,6 +40,8 @@ class DSALinkedList:
                     self.head = current.next
                 else:
                     previous.next = current.next
+                if current is self.tail:
+                    self.tail = previous
                 self.count -= 1
                 return current.value
             previous, current = current, current.next
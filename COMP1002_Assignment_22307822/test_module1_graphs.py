@@ -0,0 +1,226 @@
+# MODULE 1 TESTS: Graph Connectivity and Caches
+# Author: Thejana Kottawatta (22307822)
+# (to run: python3 -m unittest test_module1_graphs, or python3 -m pytest)
+
+import os
+import random
+import tempfile
+import tracemalloc
+import unittest
+from unittest import mock
+import module1_graphs
+from module1_graphs import DSAGraph, DSAContractionHierarchy, DSAPathTable
+
+def BuildGraph(labels, corridors):
+    """Builds a DSAGraph from a list of labels and (label1, label2, walking_time) corridors."""
+    graph = DSAGraph()
+    for label in labels:
+        graph.addVertex(label)
+    for label1, label2, walking_time in corridors:
+        graph.addEdge(label1, label2, walking_time)
+    return graph
+
+class TestCriticalCorridors(unittest.TestCase):
+    def testParallelCorridorsAreOneBridge(self):
+        # A and B are joined only by two parallel corridors; closing the pair cuts A off
+        graph = BuildGraph(["A", "B", "C"], [("A", "B", 2), ("A", "B", 5), ("B", "C", 1)])
+        self.assertTrue(graph.isCriticalCorridor("A", "B"))
+        self.assertTrue(graph.isCriticalCorridor("B", "C"))
+        graph.removeEdge("A", "B")
+        self.assertFalse(graph.isReachable("A", "C"))
+
+    def testParallelCorridorsOnACycleAreNotCritical(self):
+        graph = BuildGraph(["A", "B", "C"], [("A", "B", 2), ("A", "B", 5), ("B", "C", 1), ("C", "A", 4)])
+        self.assertFalse(graph.isCriticalCorridor("A", "B"))
+        self.assertTrue(graph.connectivityAnalysis(verbose=False).bridges.isEmpty())
+
+    def testMatchesRemovingEachPair(self):
+        # Brute force: a pair is critical exactly when removeEdge makes its ends unreachable
+        random.seed(7)
+        for _ in range(30):
+            labels = [f"D{i}" for i in range(8)]
+            corridors = [(random.choice(labels), random.choice(labels), random.randint(1, 9)) for _ in range(10)]
+            corridors = [(a, b, w) for a, b, w in corridors if a != b]
+            for label1, label2, _ in corridors:
+                graph = BuildGraph(labels, corridors)
+                critical = graph.isCriticalCorridor(label1, label2)
+                graph.removeEdge(label1, label2)
+                self.assertEqual(critical, not graph.isReachable(label1, label2))
+
+class TestCycles(unittest.TestCase):
+    def testParallelCorridorsCloseOneCycle(self):
+        graph = BuildGraph(["A", "B", "C"], [("A", "B", 2), ("B", "C", 3), ("C", "A", 1), ("C", "A", 4)])
+        cycles = [list(cycle) for cycle in graph.fundamentalCycles()]
+        self.assertEqual(cycles, [["A", "B", "C", "A"]])
+
+    def testParallelTreeCorridorsAreNotACycle(self):
+        graph = BuildGraph(["A", "B", "C"], [("A", "B", 2), ("A", "B", 5), ("B", "C", 1)])
+        self.assertTrue(graph.fundamentalCycles().isEmpty())
+        self.assertIsNone(graph.depthFirstSearchCycleFind(verbose=False).back_edge)
+
+    def testCountMatchesDistinctPairs(self):
+        # One fundamental cycle per distinct corridor pair beyond a spanning forest: E' - V + C
+        random.seed(11)
+        for _ in range(30):
+            labels = [f"D{i}" for i in range(8)]
+            corridors = [(random.choice(labels), random.choice(labels), random.randint(1, 9)) for _ in range(14)]
+            corridors = [(a, b, w) for a, b, w in corridors if a != b]
+            graph = BuildGraph(labels, corridors)
+            pairs = len({frozenset((a, b)) for a, b, _ in corridors})
+            components = graph.connectivityAnalysis(verbose=False).getComponentCount()
+            self.assertEqual(len(graph.fundamentalCycles()), pairs - len(labels) + components)
+
+class TestContractionHierarchyFile(unittest.TestCase):
+    def testSavedFileUsesFixedWidthEntries(self):
+        random.seed(5)
+        labels = [f"D{i}" for i in range(30)]
+        corridors = [(labels[i], labels[i + 1], random.randint(1, 9)) for i in range(29)]
+        corridors += [(random.choice(labels), random.choice(labels), random.randint(1, 20)) for _ in range(30)]
+        graph = BuildGraph(labels, corridors)
+        hierarchy = graph.buildContractionHierarchy()
+
+        work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(work_dir.cleanup)
+        file_path = os.path.join(work_dir.name, "hierarchy.bin")
+        key = bytes(range(32))
+        hierarchy.save(file_path, key)
+        with open(file_path, 'rb') as f:
+            header = f.read(DSAContractionHierarchy.HEADER.size)
+        _, _, _, num_vertices, num_edges, _ = DSAContractionHierarchy.HEADER.unpack(header)
+        label_bytes = sum(4 + len(label.encode("utf-8")) for label in labels)
+        # rank (4 bytes), offsets (8), targets (4), weights (8), middle (4) on every platform
+        expected = len(header) + label_bytes + 4 * num_vertices + 8 * (num_vertices + 1) + 16 * num_edges
+        self.assertEqual(os.path.getsize(file_path), expected)
+
+        loaded = DSAContractionHierarchy.load(file_path, key)
+        for _ in range(20):
+            start, end = random.choice(labels), random.choice(labels)
+            self.assertEqual(loaded.dijkstraAlgorithm(start, end, verbose=False).cost,
+                             graph.dijkstraAlgorithm(start, end, verbose=False).cost)
+
+class TestPathTableFile(unittest.TestCase):
+    def testWideHopsUseFourByteEntries(self):
+        work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(work_dir.cleanup)
+        file_path = os.path.join(work_dir.name, "table.bin")
+        labels = ["A", "B", "C"]
+        table = DSAPathTable(labels, "q", "I") # The hop typecode tables of 65535+ departments get
+        table.setRow(0, [0, 2, 5], [0, 1, 1]) # A - B - C, 2 + 3 minutes
+        table.setRow(1, [2, 0, 3], [0, 1, 2])
+        table.save(file_path, bytes(32))
+        label_bytes = sum(4 + len(label) for label in labels)
+        self.assertEqual(os.path.getsize(file_path), DSAPathTable.HEADER.size + label_bytes + 9 * (8 + 4))
+
+        loaded = DSAPathTable.load(file_path, bytes(32))
+        path, cost = loaded.getPath("A", "C")
+        self.assertEqual((list(path), cost), (["A", "B", "C"], 5))
+        self.assertIsNone(loaded.getPath("C", "A")) # Row never set: no next hop
+
+class TestHopDistances(unittest.TestCase):
+    def testChangingTheResultLeavesTheCacheAlone(self):
+        graph = BuildGraph(["A", "B", "C", "D"], [("A", "B", 1), ("B", "C", 1), ("C", "D", 1)])
+        hops = graph.hopDistances("A")
+        self.assertEqual(list(hops), [0, 1, 2, 3])
+        hops[graph.getVertex("D").index] = 1
+        self.assertFalse(graph.isWithinHops("A", "D", 2))
+        self.assertEqual(list(graph.hopDistances("A")), [0, 1, 2, 3])
+
+class TestKShortestPaths(unittest.TestCase):
+    def testRanksLooplessPaths(self):
+        graph = BuildGraph(["A", "B", "C", "D"], [("A", "B", 1), ("B", "D", 1), ("A", "C", 2), ("C", "D", 2), ("B", "C", 1)])
+        result = graph.kShortestPaths("A", "D", 5, verbose=False)
+        paths = [(list(labels), cost) for labels, cost in result.paths]
+        self.assertEqual(paths[0], (["A", "B", "D"], 2))
+        # Three loopless paths tie at 4 minutes
+        self.assertEqual(sorted(paths[1:]), [(["A", "B", "C", "D"], 4), (["A", "C", "B", "D"], 4), (["A", "C", "D"], 4)])
+
+    def testStartIsEndGivesOnePath(self):
+        graph = BuildGraph(["A", "B"], [("A", "B", 1)])
+        result = graph.kShortestPaths("A", "A", 3, verbose=False)
+        self.assertEqual([(list(labels), cost) for labels, cost in result.paths], [(["A"], 0)])
+
+    def testRejectsNonPositiveK(self):
+        graph = BuildGraph(["A", "B"], [("A", "B", 1)])
+        for k in (0, -1):
+            with self.assertRaises(ValueError):
+                graph.kShortestPaths("A", "B", k, verbose=False)
+
+class TestFromCsv(unittest.TestCase):
+    def WriteFiles(self, depts_text, corridors_text):
+        """Writes the CSV pair into a temporary directory and returns their paths."""
+        work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(work_dir.cleanup)
+        depts_file = os.path.join(work_dir.name, "departments.csv")
+        corridors_file = os.path.join(work_dir.name, "corridors.csv")
+        with open(depts_file, 'w', encoding='utf-8') as f:
+            f.write(depts_text)
+        with open(corridors_file, 'w', encoding='utf-8') as f:
+            f.write(corridors_text)
+        return depts_file, corridors_file
+
+    def testBlankRowsAreSkippedAndNotCounted(self):
+        depts_file, corridors_file = self.WriteFiles(
+            "department_name\nA\n\nB\nC\n\n",
+            "department1,department2,walking_time\n\nA,B,3\n\n\nB,C,4\n")
+        graph = DSAGraph.fromCsv(depts_file, corridors_file, chunk_size=2)
+        self.assertEqual(graph.loadStats.department_rows, 3)
+        self.assertEqual(graph.loadStats.corridor_rows, 2)
+        self.assertTrue(graph.isReachable("A", "C"))
+
+    def testPeakMemoryBelongsToTheLoad(self):
+        depts_file, corridors_file = self.WriteFiles(
+            "department_name\n" + "".join(f"D{i}\n" for i in range(2000)),
+            "department1,department2,walking_time\n" + "".join(f"D{i},D{i + 1},1\n" for i in range(1999)))
+        self.assertIsNone(DSAGraph.fromCsv(depts_file, corridors_file).loadStats.peak_memory_mb)
+        peak = DSAGraph.fromCsv(depts_file, corridors_file, trace_memory=True).loadStats.peak_memory_mb
+        self.assertGreater(peak, 0)
+        self.assertFalse(tracemalloc.is_tracing())
+
+        # An earlier, larger allocation must not show up in this load's figure
+        tracemalloc.start()
+        try:
+            ballast = bytearray(64 * 1024 * 1024)
+            del ballast
+            traced_peak = DSAGraph.fromCsv(depts_file, corridors_file, trace_memory=True).loadStats.peak_memory_mb
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+        self.assertLess(traced_peak, 2 * peak + 1)
+
+    def testEmptyFileRaisesValueError(self):
+        depts_file, corridors_file = self.WriteFiles("", "department1,department2,walking_time\n")
+        with self.assertRaises(ValueError):
+            DSAGraph.fromCsv(depts_file, corridors_file)
+
+    def testMissingColumnRaisesValueError(self):
+        depts_file, corridors_file = self.WriteFiles("department_name\nA\n", "department1,department2\nA,A\n")
+        with self.assertRaises(ValueError):
+            DSAGraph.fromCsv(depts_file, corridors_file)
+
+class TestFrozenGraphOpen(unittest.TestCase):
+    def testInvalidFilesCloseTheMapping(self):
+        work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(work_dir.cleanup)
+        file_path = os.path.join(work_dir.name, "graph.bin")
+        BuildGraph(["A", "B", "C"], [("A", "B", 2), ("B", "C", 3)]).saveBinary(file_path)
+        with open(file_path, 'rb') as f:
+            data = f.read()
+
+        mappings = []
+        real_mmap = module1_graphs.mmap.mmap
+        def RecordingMmap(*args, **kwargs):
+            mapped = real_mmap(*args, **kwargs)
+            mappings.append(mapped)
+            return mapped
+
+        # Short file, bad magic, truncated CSR arrays, truncated labels, wrong key
+        cases = [(data[:10], None), (b"X" + data[1:], None), (data[:80], None), (data[:-1], None), (data, b"k" * 32)]
+        with mock.patch.object(module1_graphs.mmap, "mmap", RecordingMmap):
+            for contents, key in cases:
+                with open(file_path, 'wb') as f:
+                    f.write(contents)
+                self.assertIsNone(DSAGraph.openBinary(file_path, key))
+                self.assertTrue(mappings[-1].closed)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# MODULE 2 TESTS: Hash Table Storage Engines
+# Author: Thejana Kottawatta (22307822)
+# (to run: python3 -m unittest test_module2_hash, or python3 -m pytest)
+
+import random
+import unittest
+from module2_hash import DSAHashTable, DSAHashStats, PatientRecord
+
+def RunAgainstDict(test, table, seed, operations, id_range):
+    """Applies the same seeded random insert/search/delete sequence to table and a dict."""
+    random.seed(seed)
+    reference = {}
+    for step in range(operations):
+        patient_id = random.randint(1, id_range)
+        action = random.random()
+        if action < 0.5:
+            record = PatientRecord(patient_id, f"Patient {patient_id}", step % 100, "Wards", random.randint(1, 5))
+            table.insert(record)
+            reference[patient_id] = record.urgencyLevel
+        elif action < 0.75:
+            table.delete(patient_id)
+            reference.pop(patient_id, None)
+        else:
+            found = table.search(patient_id)
+            if patient_id in reference:
+                test.assertIsNotNone(found)
+                test.assertEqual(found.urgencyLevel, reference[patient_id])
+            else:
+                test.assertIsNone(found)
+        test.assertEqual(table.count, len(reference))
+
+    for patient_id in range(1, id_range + 1):
+        found = table.search(patient_id)
+        if patient_id in reference:
+            test.assertEqual(found.urgencyLevel, reference[patient_id])
+        else:
+            test.assertIsNone(found)
+
+def CheckRobinHoodSlots(test, table):
+    """Every occupied slot's stored probe distance is its real distance from its home slot."""
+    for index in range(table.capacity):
+        dist = table.slot_dists[index]
+        if dist >= 0:
+            test.assertEqual(dist, (index - table.Hash(table.slot_keys[index])) % table.capacity)
+
+class TestMatchesDict(unittest.TestCase):
+    def RunStorage(self, **options):
+        stats = DSAHashStats()
+        table = DSAHashTable(initial_size=11, verbose=False, trace=stats, **options)
+        RunAgainstDict(self, table, seed=41, operations=20000, id_range=3000)
+        self.assertGreaterEqual(stats.events.get("resize", 0), 5)
+        return table
+
+    def testChaining(self):
+        self.RunStorage()
+
+    def testRobinHood(self):
+        table = self.RunStorage(storage="robin_hood")
+        CheckRobinHoodSlots(self, table)
+
+    def testIncrementalResize(self):
+        table = self.RunStorage(incremental_resize=True)
+        table.MigrateStep(table.old_capacity) # Nothing may be lost once migration finishes
+        self.assertIsNone(table.old_table)
+        self.assertEqual(sum(len(chain) for chain in table.table if chain is not None), table.count)
+
+    def testIncrementalResizeMidMigration(self):
+        # A slow migration keeps searches and deletes hitting both bucket arrays
+        table = DSAHashTable(initial_size=11, verbose=False, incremental_resize=True)
+        table.migrate_step = 1
+        RunAgainstDict(self, table, seed=7, operations=5000, id_range=800)
+
+class TestRobinHoodCollisions(unittest.TestCase):
+    def testEveryKeyOnOneSlotWrapsAround(self):
+        # All keys share the last slot as home, so every probe wraps past the end of the array
+        table = DSAHashTable(initial_size=11, verbose=False, storage="robin_hood",
+                             int_fast_path=False, string_hash=lambda key_str: -1)
+        RunAgainstDict(self, table, seed=3, operations=3000, id_range=400)
+        CheckRobinHoodSlots(self, table)
+        self.assertGreater(max(table.slot_dists), 100) # Long probes stay exact in the 16-bit distances
+
+    def testBackwardShiftDeletion(self):
+        table = DSAHashTable(initial_size=11, verbose=False, storage="robin_hood",
+                             int_fast_path=False, string_hash=lambda key_str: 0)
+        for patient_id in range(1, 8):
+            table.insert(PatientRecord(patient_id, "Patient", 40, "Wards", 3))
+        table.delete(1)
+        self.assertEqual(list(table.slot_dists[:7]), [0, 1, 2, 3, 4, 5, -1])
+        for patient_id in range(2, 8):
+            self.assertIsNotNone(table.search(patient_id))
+        CheckRobinHoodSlots(self, table)
+
+if __name__ == "__main__":
+    unittest.main()